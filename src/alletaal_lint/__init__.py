@@ -7,6 +7,18 @@ Based on LiNT (Leesbaarheids­instrument voor Nederlandse Teksten)
 __version__ = "1.0.0"
 __author__ = "City of Amsterdam"
 
-from .core import Document, LintScorer, Sentence
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["Document", "Sentence", "LintScorer"]
+if TYPE_CHECKING:
+    from .core import Document, LintScorer, Sentence, warmup
+
+__all__ = ["Document", "Sentence", "LintScorer", "warmup"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the spaCy-backed core lazily, keeping CLI start-up fast."""
+    if name in __all__:
+        from . import core
+
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,14 +4,59 @@ FastAPI server for LiNT readability assessment.
 This module provides REST API endpoints for the LiNT readability scoring system.
 """
 
+import asyncio
+import logging
+import os
 import re
-from typing import Any, Dict, List
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, TypeVar
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
-from .core import Document, Sentence
+from .core import Document, LintScorer, Sentence
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+# Number of distinct texts whose results are kept per endpoint
+ANALYSIS_CACHE_SIZE = int(os.getenv("ALLETAAL_CACHE_SIZE", "1024"))
+
+# Parser processes used by /score-batch (-1 uses all cores)
+BATCH_N_PROCESS = int(os.getenv("ALLETAAL_N_PROCESS", "1"))
+if BATCH_N_PROCESS != -1 and BATCH_N_PROCESS < 1:
+    raise ValueError(
+        f"ALLETAAL_N_PROCESS must be -1 (all cores) or at least 1, "
+        f"got {BATCH_N_PROCESS}"
+    )
+
+# Common Markdown syntax, stripped in a single pass. Images and links come
+# first so their brackets are removed as a whole before emphasis markers.
+_MD_RE = re.compile(
+    r"!\[.*?\]\(.*?\)"  # Images
+    r"|\[.*?\]\(.*?\)"  # Links
+    r"|\*{1,3}"  # Bold/italic markers
+    r"|_+"  # Underscore emphasis
+    r"|~{2}"  # Strikethrough
+    r"|`{1,3}"  # Code markers
+    r"|#{1,6} "  # Headers
+    r"|>-"  # Blockquotes
+    r"|--+"  # Horizontal lines
+    r"|\|"  # Table markers
+)
+# Characters any of the patterns above must start with; plain prose has none
+_MD_FASTSCAN = re.compile(r"[*_~`#>\[|]|--")
+
+
+def remove_markdown(text: str) -> str:
+    """Remove common Markdown syntax from text."""
+    if not _MD_FASTSCAN.search(text):
+        return text.strip()
+    return _MD_RE.sub("", text).strip()
 
 
 class TextInput(BaseModel):
@@ -34,6 +79,20 @@ class DocumentScoreResponse(BaseModel):
     difficulty_level: int = Field(..., description="Overall difficulty level (1-4)")
 
 
+class BatchTextInput(BaseModel):
+    """Input model for several texts to be scored together."""
+
+    texts: List[str] = Field(..., description="Texts to analyze for readability")
+
+
+class BatchScoreResponse(BaseModel):
+    """Response model for batch document scoring."""
+
+    results: List[DocumentScoreResponse] = Field(
+        ..., description="Document scores, in input order"
+    )
+
+
 class SentenceAnalysis(BaseModel):
     """Model for individual sentence analysis."""
 
@@ -64,6 +123,109 @@ class DetailedDocumentResponse(BaseModel):
     )
 
 
+# Blocking scoring helpers, keyed on the cleaned text. The endpoints run these
+# in worker threads so that spaCy work does not stall the event loop.
+@lru_cache(maxsize=ANALYSIS_CACHE_SIZE)
+def _score_sentence(text: str) -> SentenceScoreResponse:
+    """Score a single sentence."""
+    sentence = Sentence(text)
+
+    return SentenceScoreResponse(
+        lint_score=sentence.calculate_lint_score(),
+        difficulty_level=sentence.get_difficulty_level(),
+    )
+
+
+@lru_cache(maxsize=ANALYSIS_CACHE_SIZE)
+def _score_document(text: str) -> DocumentScoreResponse:
+    """Score a document."""
+    document = Document(text)
+
+    return DocumentScoreResponse(
+        lint_score=document.calculate_lint_score(),
+        difficulty_level=document.get_difficulty_level(),
+    )
+
+
+def _score_batch(texts: List[str]) -> BatchScoreResponse:
+    """Score several documents, parsing them together."""
+    scores = Document.score_many(texts, n_process=BATCH_N_PROCESS)
+
+    return BatchScoreResponse(
+        results=[
+            DocumentScoreResponse(
+                lint_score=score,
+                difficulty_level=LintScorer.get_difficulty_level(score),
+            )
+            for score in scores
+        ]
+    )
+
+
+def _analyze_sentence(sentence: Sentence) -> SentenceAnalysis:
+    """Collect the detailed metrics of one sentence."""
+    # Values come straight from the typed scoring methods, so skip validation
+    return SentenceAnalysis.model_construct(
+        sentence=sentence.text,
+        lint_score=sentence.calculate_lint_score(),
+        difficulty_level=sentence.get_difficulty_level(),
+        word_frequency_log=sentence.get_word_frequency_log(),
+        max_dependency_length=sentence.get_max_dependency_length(),
+        content_words_proportion=sentence.get_proportion_of_content_words_excluding_adverbs(),
+        concrete_nouns_proportion=sentence.get_proportion_of_broadly_concrete_nouns(),
+    )
+
+
+def _stream_sentences(document: Document) -> Iterator[str]:
+    """Yield one NDJSON line per sentence as it is scored."""
+    for sentence in document.sentences:
+        yield _analyze_sentence(sentence).model_dump_json() + "\n"
+
+
+@lru_cache(maxsize=ANALYSIS_CACHE_SIZE)
+def _analyze_document(text: str) -> DetailedDocumentResponse:
+    """Analyze a document in detail."""
+    document = Document(text)
+
+    sentences = [_analyze_sentence(sentence) for sentence in document.sentences]
+
+    analysis = document.get_detailed_analysis()
+
+    return DetailedDocumentResponse(
+        document_score=analysis["document_score"],
+        document_level=analysis["document_level"],
+        sentence_count=analysis["sentence_count"],
+        average_sentence_length=analysis["average_sentence_length"],
+        sentences=sentences,
+    )
+
+
+async def _run(scorer: Callable[[str], T], request: Request, text: str) -> T:
+    """Run a cached scorer in a worker thread on Markdown-free text.
+
+    Requests sent with ``Cache-Control: no-store`` bypass the result cache.
+    """
+    if "no-store" in request.headers.get("cache-control", ""):
+        scorer = getattr(scorer, "__wrapped__", scorer)
+    return await asyncio.to_thread(scorer, remove_markdown(text))
+
+
+def _warm_up() -> None:
+    """Run a short document through the full parsing and scoring path."""
+    Document("Opwarmzin. Nog een zin.").get_detailed_analysis()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Warm up the spaCy pipeline before the first request is served."""
+    try:
+        await asyncio.to_thread(_warm_up)
+    except Exception:
+        # Keep serving so that /health can report the problem with a 503
+        logger.exception("Warm-up failed; the service is unhealthy")
+    yield
+
+
 def create_app() -> FastAPI:
     """Create and configure FastAPI application."""
     app = FastAPI(
@@ -74,6 +236,7 @@ def create_app() -> FastAPI:
         version="1.0.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        lifespan=lifespan,
     )
 
     # CORS middleware
@@ -85,26 +248,6 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
-    def remove_markdown(text: str) -> str:
-        """Remove common Markdown syntax from text."""
-        patterns = [
-            r"\*{1,3}",  # Bold/italic markers
-            r"_+",  # Underscore emphasis
-            r"~{2}",  # Strikethrough
-            r"`{1,3}",  # Code markers
-            r"#{1,6} ",  # Headers
-            r"\[.*?\]\(.*?\)",  # Links
-            r"!\[.*?\]\(.*?\)",  # Images
-            r">-",  # Blockquotes
-            r"--+",  # Horizontal lines
-            r"\|",  # Table markers
-        ]
-
-        for pattern in patterns:
-            text = re.sub(pattern, "", text)
-
-        return text.strip()
-
     @app.get("/")
     async def root() -> Dict[str, Any]:
         """Root endpoint with basic API information."""
@@ -117,7 +260,9 @@ def create_app() -> FastAPI:
             "endpoints": {
                 "score_sentence": "/score-sentence",
                 "score_document": "/score-document",
+                "score_batch": "/score-batch",
                 "analyze_document": "/analyze-document",
+                "analyze_document_stream": "/analyze-document-stream",
                 "methodology": "/methodology",
                 "health": "/health",
             },
@@ -145,78 +290,76 @@ def create_app() -> FastAPI:
         """Health check endpoint."""
         try:
             # Test that spaCy model can be loaded
-            test_sentence = Sentence("Test zin.")
+            Sentence("Test zin.")
             return {"status": "healthy", "spacy_model": "nl_core_news_sm loaded"}
         except Exception as e:
             raise HTTPException(status_code=503, detail=f"Service unhealthy: {str(e)}")
 
     @app.post("/score-sentence", response_model=SentenceScoreResponse)
-    async def score_sentence(input_data: TextInput) -> SentenceScoreResponse:
+    async def score_sentence(
+        input_data: TextInput, request: Request
+    ) -> SentenceScoreResponse:
         """Score a single sentence for readability."""
         try:
-            clean_text = remove_markdown(input_data.text)
-            sentence = Sentence(clean_text)
-
-            return SentenceScoreResponse(
-                lint_score=sentence.calculate_lint_score(),
-                difficulty_level=sentence.get_difficulty_level(),
-            )
+            return await _run(_score_sentence, request, input_data.text)
         except Exception as e:
             raise HTTPException(
                 status_code=500, detail=f"Error scoring sentence: {str(e)}"
             )
 
     @app.post("/score-document", response_model=DocumentScoreResponse)
-    async def score_document(input_data: TextInput) -> DocumentScoreResponse:
+    async def score_document(
+        input_data: TextInput, request: Request
+    ) -> DocumentScoreResponse:
         """Score a document for readability."""
         try:
-            clean_text = remove_markdown(input_data.text)
-            document = Document(clean_text)
-
-            return DocumentScoreResponse(
-                lint_score=document.calculate_lint_score(),
-                difficulty_level=document.get_difficulty_level(),
-            )
+            return await _run(_score_document, request, input_data.text)
         except Exception as e:
             raise HTTPException(
                 status_code=500, detail=f"Error scoring document: {str(e)}"
             )
 
+    @app.post("/score-batch", response_model=BatchScoreResponse)
+    async def score_batch(input_data: BatchTextInput) -> BatchScoreResponse:
+        """Score several documents for readability in one request."""
+        try:
+            texts = [remove_markdown(text) for text in input_data.texts]
+            return await asyncio.to_thread(_score_batch, texts)
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Error scoring documents: {str(e)}"
+            )
+
     @app.post("/analyze-document", response_model=DetailedDocumentResponse)
-    async def analyze_document(input_data: TextInput) -> DetailedDocumentResponse:
+    async def analyze_document(
+        input_data: TextInput, request: Request
+    ) -> DetailedDocumentResponse:
         """Provide detailed analysis of document readability."""
         try:
-            clean_text = remove_markdown(input_data.text)
-            document = Document(clean_text)
-
-            sentences = []
-            for sentence in document.sentences:
-                sentences.append(
-                    SentenceAnalysis(
-                        sentence=sentence.text,
-                        lint_score=sentence.calculate_lint_score(),
-                        difficulty_level=sentence.get_difficulty_level(),
-                        word_frequency_log=sentence.get_word_frequency_log(),
-                        max_dependency_length=sentence.get_max_dependency_length(),
-                        content_words_proportion=sentence.get_proportion_of_content_words_excluding_adverbs(),
-                        concrete_nouns_proportion=sentence.get_proportion_of_broadly_concrete_nouns(),
-                    )
-                )
-
-            analysis = document.get_detailed_analysis()
-
-            return DetailedDocumentResponse(
-                document_score=analysis["document_score"],
-                document_level=analysis["document_level"],
-                sentence_count=analysis["sentence_count"],
-                average_sentence_length=analysis["average_sentence_length"],
-                sentences=sentences,
+            return await _run(_analyze_document, request, input_data.text)
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Error analyzing document: {str(e)}"
+            )
+
+    @app.post("/analyze-document-stream")
+    async def analyze_document_stream(input_data: TextInput) -> StreamingResponse:
+        """Stream per-sentence analyses as newline-delimited JSON."""
+        try:
+            # The whole document is parsed up front, so parse errors still map
+            # to a 500; only per-sentence scoring and serialisation are streamed
+            document = await asyncio.to_thread(
+                Document, remove_markdown(input_data.text)
             )
         except Exception as e:
             raise HTTPException(
                 status_code=500, detail=f"Error analyzing document: {str(e)}"
             )
 
+        return StreamingResponse(
+            _stream_sentences(document), media_type="application/x-ndjson"
+        )
+
     return app
 
 
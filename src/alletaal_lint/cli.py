@@ -7,7 +7,7 @@ This module provides a CLI for the LiNT readability assessment tool.
 import json
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 import typer
 from rich.console import Console
@@ -15,8 +15,6 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
-from .core import Document, Sentence
-
 app = typer.Typer(
     name="alletaal-lint",
     help="Dutch Text Readability Assessment using LiNT methodology. "
@@ -26,32 +24,77 @@ app = typer.Typer(
 
 console = Console()
 
+# Indexed by difficulty level (1-4); index 0 holds the fallback value
+_DIFFICULTY_DESCRIPTIONS = (
+    "Unknown",
+    "Very Difficult",
+    "Difficult",
+    "Moderate",
+    "Easy",
+)
+_DIFFICULTY_COLORS = ("white", "red", "orange", "yellow", "green")
+
 
 def get_difficulty_description(level: int) -> str:
     """Get human-readable description of difficulty level."""
-    descriptions = {1: "Very Difficult", 2: "Difficult", 3: "Moderate", 4: "Easy"}
-    return descriptions.get(level, "Unknown")
+    if 0 < level < len(_DIFFICULTY_DESCRIPTIONS):
+        return _DIFFICULTY_DESCRIPTIONS[level]
+    return _DIFFICULTY_DESCRIPTIONS[0]
 
 
 def get_difficulty_color(level: int) -> str:
     """Get color for difficulty level display."""
-    colors = {1: "red", 2: "orange", 3: "yellow", 4: "green"}
-    return colors.get(level, "white")
+    if 0 < level < len(_DIFFICULTY_COLORS):
+        return _DIFFICULTY_COLORS[level]
+    return _DIFFICULTY_COLORS[0]
+
+
+def _validate_format(value: str) -> str:
+    """Only the table and json output formats exist."""
+    if value not in ("table", "json"):
+        raise typer.BadParameter(f"unknown format '{value}' (use table or json)")
+    return value
+
+
+def _validate_n_process(value: int) -> int:
+    """Only -1 (all cores) or a positive number of processes is accepted."""
+    if value != -1 and value < 1:
+        raise typer.BadParameter("must be -1 (all cores) or at least 1")
+    return value
 
 
 @app.command()
 def score(
     text: Optional[str] = typer.Option(None, "--text", "-t", help="Text to analyze"),
-    file: Optional[Path] = typer.Option(None, "--file", "-f", help="File to analyze"),
+    file: Optional[Path] = typer.Option(
+        None, "--file", "-f", help="File, or directory of .txt files, to analyze"
+    ),
     output: Optional[Path] = typer.Option(
         None, "--output", "-o", help="Output file for results"
     ),
-    format: str = typer.Option("table", "--format", help="Output format (table, json)"),
+    format: str = typer.Option(
+        "table",
+        "--format",
+        help="Output format (table, json)",
+        callback=_validate_format,
+    ),
     detailed: bool = typer.Option(
         False, "--detailed", "-d", help="Show detailed analysis"
     ),
+    n_process: int = typer.Option(
+        1,
+        "--n-process",
+        help="Parser processes when --file is a directory (-1 uses all cores)",
+        callback=_validate_n_process,
+    ),
 ) -> None:
     """Score text or file for readability."""
+    from .core import Document
+
+    if n_process != 1 and not (text is None and file is not None and file.is_dir()):
+        raise typer.BadParameter(
+            "only applies when --file is a directory", param_hint="'--n-process'"
+        )
 
     # Get input text
     if text:
@@ -60,6 +103,14 @@ def score(
         if not file.exists():
             console.print(f"[red]Error: File {file} not found[/red]")
             raise typer.Exit(1)
+        if file.is_dir():
+            if detailed:
+                console.print(
+                    "[red]Error: --detailed is not supported for directories[/red]"
+                )
+                raise typer.Exit(1)
+            _score_directory(file, output, format, n_process)
+            return
         try:
             input_text = file.read_text(encoding="utf-8")
         except Exception as e:
@@ -76,7 +127,7 @@ def score(
             TextColumn("[progress.description]{task.description}"),
             console=console,
         ) as progress:
-            task = progress.add_task("Analyzing text...", total=None)
+            progress.add_task("Analyzing text...", total=None)
 
             try:
                 document = Document(input_text)
@@ -166,6 +217,63 @@ def score(
             console.print(sentence_table)
 
 
+def _score_directory(
+    directory: Path, output: Optional[Path], format: str, n_process: int
+) -> None:
+    """Score every .txt file in a directory, parsing them together."""
+    from .core import Document, LintScorer
+
+    files = sorted(directory.glob("*.txt"))
+    if not files:
+        console.print(f"[red]Error: No .txt files found in {directory}[/red]")
+        raise typer.Exit(1)
+
+    try:
+        texts = [path.read_text(encoding="utf-8") for path in files]
+        scores = Document.score_many(texts, n_process=n_process)
+    except Exception as e:
+        console.print(f"[red]Error analyzing files: {e}[/red]")
+        raise typer.Exit(1)
+
+    results: List[Dict[str, Any]] = []
+    for path, doc_score in zip(files, scores):
+        level = LintScorer.get_difficulty_level(doc_score)
+        results.append(
+            {
+                "file": path.name,
+                "document_score": doc_score,
+                "document_level": level,
+                "document_level_description": get_difficulty_description(level),
+            }
+        )
+
+    if format == "json":
+        json_output = json.dumps(results, indent=2, ensure_ascii=False)
+
+        if output:
+            output.write_text(json_output, encoding="utf-8")
+            console.print(f"[green]Results saved to {output}[/green]")
+        else:
+            console.print(json_output)
+        return
+
+    results_table = Table(title="Document Readability Summary")
+    results_table.add_column("File", style="bold")
+    results_table.add_column("LiNT Score", justify="center")
+    results_table.add_column("Difficulty Level")
+
+    for result in results:
+        color = get_difficulty_color(result["document_level"])
+        results_table.add_row(
+            result["file"],
+            str(result["document_score"]),
+            f"[{color}]{result['document_level']} - "
+            f"{result['document_level_description']}[/{color}]",
+        )
+
+    console.print(results_table)
+
+
 @app.command()
 def sentence(
     text: str = typer.Argument(..., help="Sentence to analyze"),
@@ -174,6 +282,7 @@ def sentence(
     ),
 ) -> None:
     """Score a single sentence for readability."""
+    from .core import Sentence
 
     try:
         sentence = Sentence(text)
@@ -225,13 +334,14 @@ def server(
     host: str = typer.Option("127.0.0.1", "--host", help="Host to bind to"),
     port: int = typer.Option(8000, "--port", help="Port to bind to"),
     reload: bool = typer.Option(False, "--reload", help="Enable auto-reload"),
+    workers: int = typer.Option(
+        1, "--workers", help="Number of worker processes (each loads the model)"
+    ),
 ) -> None:
     """Start the FastAPI server."""
     try:
         import uvicorn
 
-        from .api import app as fastapi_app
-
         console.print(f"[green]Starting server on {host}:{port}[/green]")
         console.print(
             f"[blue]API documentation available at http://{host}:{port}/docs[/blue]"
@@ -242,6 +352,7 @@ def server(
             host=host,
             port=port,
             reload=reload,
+            workers=workers,
         )
     except ImportError:
         console.print("[red]Error: uvicorn is required to run the server[/red]")
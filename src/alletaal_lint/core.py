@@ -12,68 +12,162 @@ remains unchanged, ensuring scientific validity while benefiting from
 contemporary NLP advances.
 """
 
-import math
-from collections import defaultdict
-from typing import Any, Dict, List, Optional, Tuple
+import os
+from functools import cached_property, lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union
 
 import spacy
+from spacy.parts_of_speech import IDS as POS_IDS  # type: ignore[import-not-found]
+from spacy.symbols import IDS as SYMBOL_IDS  # type: ignore[import-not-found]
 from wordfreq import zipf_frequency
 
+# Number of documents per ``nlp.pipe`` batch in from_texts and score_many
+SPACY_BATCH_SIZE = int(os.getenv("ALLETAAL_SPACY_BATCH", "64"))
+
+# Pipeline components whose output is never read by the LiNT features
+EXCLUDED_COMPONENTS = ["ner"]
+
+# Universal POS tags as spaCy symbol IDs, so checks compare ints, not strings
+_NOUN_POS: int = POS_IDS["NOUN"]
+_CONTENT_POS: FrozenSet[int] = frozenset(
+    POS_IDS[pos] for pos in ("NOUN", "PROPN", "VERB", "ADJ", "NUM", "SYM")
+)
+
+# Dependency label of punctuation, also a built-in symbol ID
+_PUNCT_DEP: int = SYMBOL_IDS["punct"]
+
+# Fine-grained (CGN) main tags that carry a word frequency / count as nouns
+_FREQ_TAGS: FrozenSet[str] = frozenset({"N", "ADJ", "WW", "BW"})
+_NOUN_TAGS: FrozenSet[str] = frozenset({"N", "SPEC"})
+
+
+@lru_cache(maxsize=1)
+def _get_nlp() -> Any:
+    """Load the Dutch spaCy model, once per process."""
+    try:
+        return spacy.load("nl_core_news_sm", exclude=EXCLUDED_COMPONENTS)
+    except OSError:
+        raise RuntimeError(
+            "Dutch spaCy model 'nl_core_news_sm' not found. "
+            "Install it with: python -m spacy download nl_core_news_sm"
+        )
+
+
+def warmup() -> None:
+    """
+    Load the shared spaCy pipeline ahead of the first analysis.
+
+    Useful as a ``multiprocessing.Pool(initializer=warmup)`` hook, so every
+    worker loads the model once at start-up instead of on its first task.
+    """
+    _get_nlp()
+
+
+@lru_cache(maxsize=200_000)
+def _zipf_nl(word: str) -> float:
+    """Zipf frequency of a lowercased Dutch word, memoized per process."""
+    return zipf_frequency(word, "nl")
+
+
+def _check_n_process(n_process: int) -> None:
+    """Reject worker counts ``nlp.pipe`` cannot handle (only -1 or >= 1)."""
+    if n_process != -1 and n_process < 1:
+        raise ValueError(
+            f"n_process must be -1 (all cores) or at least 1, got {n_process}"
+        )
+
+
+def _split_tag(tag: str) -> Tuple[str, str]:
+    """Split a fine-grained tag like 'N|eigen|ev' into main and first sub-tag."""
+    main_tag, _, sub_tags = tag.partition("|")
+    return main_tag, sub_tags.partition("|")[0]
+
+
+def _dependency_distance(token: spacy.tokens.Token) -> int:
+    """Calculate dependency distance between token and its head."""
+    if token.dep == _PUNCT_DEP:
+        return 0
+    return int(abs(token.head.i - token.i))
+
+
+def _word_frequency(lower: str, tag: str, first_sub_tag: str) -> Optional[float]:
+    """Get zipf frequency for nouns, adjectives, verbs and adverbs.
+
+    ``lower`` is the lowercased word (``token.lower_``); wordfreq case-folds
+    its input anyway, so this only normalises the lookup cache keys.
+    """
+    if tag not in _FREQ_TAGS:
+        return None
+
+    if first_sub_tag == "eigen":
+        return None
+
+    freq = _zipf_nl(lower)
+    return freq if freq > 0 else 1.3555  # Default frequency for unknown words
+
 
 class WordStats:
     """Statistics and linguistic features for individual words."""
 
+    __slots__ = (
+        "token",
+        "text",
+        "lemma",
+        "dep_length",
+        "tag",
+        "_first_sub",
+        "pos",
+        "pos_id",
+        "_frequency",
+    )
+
     def __init__(self, token: spacy.tokens.Token) -> None:
         self.token = token
         self.text = token.text
         self.lemma = token.lemma_
-        self.dep_length = self._get_dependency_distance(token)
-        self.tag = token.tag_.split("|")[0] if token.tag_ else ""
-        self.sub_tags = token.tag_.split("|")[1:] if token.tag_ else []
+        self.dep_length = _dependency_distance(token)
+        self.tag, self._first_sub = _split_tag(token.tag_)  # "" if none
         self.pos = token.pos_
-        self.gender: Optional[str] = None
-        self.number: Optional[str] = None
-        self._parse_morphology(token.morph)
-
-    def _get_dependency_distance(self, token: spacy.tokens.Token) -> int:
-        """Calculate dependency distance between token and its head."""
-        if token.dep_ in ["punct"]:
-            return 0
-        return int(abs(token.head.i - token.i))
-
-    def _parse_morphology(self, morph: spacy.tokens.MorphAnalysis) -> None:
-        """Parse morphological features from spaCy token."""
-        if hasattr(morph, "get"):
-            gender_list = morph.get("Gender", [])
-            number_list = morph.get("Number", [])
-            self.gender = gender_list[0] if gender_list else None
-            self.number = number_list[0] if number_list else None
+        self.pos_id = token.pos
+        # Looked up once here; the sentence metrics read it repeatedly
+        self._frequency = _word_frequency(token.lower_, self.tag, self._first_sub)
+
+    @property
+    def sub_tags(self) -> List[str]:
+        """Sub-tags of the fine-grained tag, e.g. ['eigen', 'ev'] for 'N|eigen|ev'."""
+        return self.token.tag_.split("|")[1:] if self.token.tag_ else []
+
+    # Morphology is not used by the LiNT features, so it is only parsed on access
+    @property
+    def gender(self) -> Optional[str]:
+        """Grammatical gender from the token's morphology, if any."""
+        return self._morph_feature("Gender")
+
+    @property
+    def number(self) -> Optional[str]:
+        """Grammatical number from the token's morphology, if any."""
+        return self._morph_feature("Number")
+
+    def _morph_feature(self, name: str) -> Optional[str]:
+        """Get the first value of a morphological feature from the spaCy token."""
+        values = self.token.morph.get(name, [])
+        return values[0] if values else None
 
     def get_word_frequency(self) -> Optional[float]:
         """Get word frequency using zipf scale."""
-        if self.tag not in ["N", "ADJ", "WW", "BW"]:
-            return None
-
-        if self.sub_tags and self.sub_tags[0] == "eigen":
-            return None
-
-        freq = zipf_frequency(self.text, "nl")
-        return freq if freq > 0 else 1.3555  # Default frequency for unknown words
+        return self._frequency
 
     def is_content_word_excluding_adverbs(self) -> bool:
         """Check if word is a content word (excluding adverbs)."""
-        return (
-            self.pos in ["NOUN", "PROPN", "VERB", "ADJ", "NUM", "SYM"]
-            and self.pos != "ADV"
-        )
+        return self.pos_id in _CONTENT_POS
 
     def is_noun_or_spec(self) -> bool:
         """Check if word is a noun or special token."""
-        return self.tag in ["N", "SPEC"]
+        return self.tag in _NOUN_TAGS
 
     def is_non_noun_content(self) -> bool:
         """Check if word is non-noun content (for concrete noun calculation)."""
-        return self.pos not in ["NOUN"]
+        return self.pos_id != _NOUN_POS
 
 
 class LintScorer:
@@ -95,14 +189,29 @@ class LintScorer:
         Returns:
             LiNT score (0-100, higher = more readable)
         """
-        score = (
+        return round(
+            LintScorer.calculate_raw_score(freq_log, al_max, content_words, concrete),
+            2,
+        )
+
+    @staticmethod
+    def calculate_raw_score(
+        freq_log: float, al_max: int, content_words: float, concrete: float
+    ) -> float:
+        """
+        Calculate the unrounded LiNT score, clamped to 0-100.
+
+        Aggregates such as the document score are computed from this value,
+        so that rounding happens only once, on the final result.
+        """
+        score = 100 - (
             3.204
             + (15.845 * freq_log)
             - (1.331 * al_max)
             - (3.829 * content_words)
             + (13.096 * concrete)
         )
-        return round(min(100.0, max(0.0, 100 - score)), 2)
+        return 0.0 if score < 0.0 else 100.0 if score > 100.0 else score
 
     @staticmethod
     def get_difficulty_level(score: float) -> int:
@@ -128,37 +237,109 @@ class LintScorer:
 class Sentence:
     """Sentence-level readability analysis."""
 
-    def __init__(self, text: str, nlp_model: Optional[Any] = None) -> None:
+    def __init__(
+        self,
+        text: str,
+        nlp_model: Optional[Any] = None,
+        doc: Optional[Union[spacy.tokens.Doc, spacy.tokens.Span]] = None,
+    ) -> None:
         self.text = text
-        self.nlp = nlp_model or self._load_nlp_model()
-        self.doc = self.nlp(text)
-        self.tokens = list(self.doc)
-        self.words = [WordStats(token) for token in self.tokens]
+        # A pre-parsed doc or sentence span (e.g. from a Document) is used as-is,
+        # so the default pipeline is only loaded when there is text to parse
+        if doc is None:
+            nlp_model = nlp_model or _get_nlp()
+            doc = nlp_model(text)
+        self.nlp = nlp_model
+        self.doc = doc
+
+    @classmethod
+    def from_doc(
+        cls,
+        doc: Union[spacy.tokens.Doc, spacy.tokens.Span],
+        nlp_model: Optional[Any] = None,
+    ) -> "Sentence":
+        """
+        Create a sentence from an already parsed spaCy doc or sentence span.
 
-    @staticmethod
-    def _load_nlp_model() -> Any:
-        """Load Dutch spaCy model."""
-        try:
-            return spacy.load("nl_core_news_sm")
-        except OSError:
-            raise RuntimeError(
-                "Dutch spaCy model 'nl_core_news_sm' not found. "
-                "Install it with: python -m spacy download nl_core_news_sm"
-            )
+        Pass the pipeline that produced ``doc`` as ``nlp_model`` to keep it
+        available as ``sentence.nlp``; no pipeline is loaded otherwise.
+        """
+        return cls(doc.text, nlp_model, doc=doc)
+
+    # The metrics below read the spaCy tokens directly; the per-word wrappers
+    # are only built when a caller asks for them.
+    @cached_property
+    def tokens(self) -> List[spacy.tokens.Token]:
+        """Tokens of the sentence."""
+        return list(self.doc)
+
+    @cached_property
+    def words(self) -> List[WordStats]:
+        """Per-word statistics of the sentence."""
+        return [WordStats(token) for token in self.doc]
+
+    @cached_property
+    def _features(self) -> Tuple[float, int, int, int, int, int, int]:
+        """Collect the raw per-token tallies behind the LiNT features in one pass.
+
+        Returns (frequency sum, frequency count, max dependency distance,
+        content words, nouns, non-noun content words, words).
+        """
+        freq_sum = 0.0
+        freq_count = 0
+        max_dep = 0
+        content_count = 0
+        total_nouns = 0
+        non_noun_content = 0
+        word_count = 0
 
-    def get_word_frequency_log(self) -> float:
-        """Calculate average log word frequency for the sentence."""
-        frequencies = []
-        for word in self.words:
-            freq = word.get_word_frequency()
+        for token in self.doc:
+            tag, first_sub = _split_tag(token.tag_)
+            pos = token.pos
+
+            freq = _word_frequency(token.lower_, tag, first_sub)
             if freq is not None and freq > 0:
-                frequencies.append(freq)
+                freq_sum += freq
+                freq_count += 1
+
+            dep = _dependency_distance(token)
+            if dep > max_dep:
+                max_dep = dep
+
+            if pos in _CONTENT_POS:
+                content_count += 1
+
+            if tag in _NOUN_TAGS:
+                total_nouns += 1
+                if pos != _NOUN_POS:
+                    non_noun_content += 1
+
+            if not (token.is_punct or token.is_space):
+                word_count += 1
+
+        return (
+            freq_sum,
+            freq_count,
+            max_dep,
+            content_count,
+            total_nouns,
+            non_noun_content,
+            word_count,
+        )
+
+    @property
+    def word_count(self) -> int:
+        """Number of words in the sentence, not counting punctuation."""
+        return self._features[6]
 
-        return sum(frequencies) / len(frequencies) if frequencies else 0
+    def get_word_frequency_log(self) -> float:
+        """Calculate average log word frequency for the sentence."""
+        freq_sum, freq_count = self._features[:2]
+        return freq_sum / freq_count if freq_count else 0.0
 
     def get_max_dependency_length(self) -> int:
         """Get maximum dependency length in the sentence."""
-        max_dep_length = max((word.dep_length for word in self.words), default=0)
+        max_dep_length = self._features[2]
 
         # Apply T-Scan adjustment for very long dependencies
         if max_dep_length > 3:
@@ -168,27 +349,19 @@ class Sentence:
 
     def count_content_words_excluding_adverbs(self) -> int:
         """Count content words excluding adverbs."""
-        return sum(1 for word in self.words if word.is_content_word_excluding_adverbs())
+        return self._features[3]
 
     def get_proportion_of_content_words_excluding_adverbs(self) -> float:
         """Get proportion of content words excluding adverbs per clause."""
         content_count = self.count_content_words_excluding_adverbs()
         clause_count = self._get_clause_count()
 
-        return content_count / clause_count if clause_count > 0 else 0
+        return content_count / clause_count if clause_count > 0 else 0.0
 
     def get_proportion_of_broadly_concrete_nouns(self) -> float:
         """Calculate proportion of broadly concrete nouns."""
-        total_nouns = 0
-        non_noun_content = 0
-
-        for word in self.words:
-            if word.is_noun_or_spec():
-                total_nouns += 1
-                if word.is_non_noun_content():
-                    non_noun_content += 1
-
-        return non_noun_content / total_nouns if total_nouns > 0 else 0
+        total_nouns, non_noun_content = self._features[4:6]
+        return non_noun_content / total_nouns if total_nouns > 0 else 0.0
 
     def _get_clause_count(self) -> int:
         """Estimate clause count (simplified implementation)."""
@@ -198,14 +371,17 @@ class Sentence:
 
     def calculate_lint_score(self) -> float:
         """Calculate LiNT readability score for the sentence."""
+        return round(self._raw_score, 2)
+
+    @cached_property
+    def _raw_score(self) -> float:
+        """Unrounded LiNT score for the sentence, computed once."""
         freq_log = self.get_word_frequency_log()
         al_max = self.get_max_dependency_length()
         content_words = self.get_proportion_of_content_words_excluding_adverbs()
         concrete = self.get_proportion_of_broadly_concrete_nouns()
 
-        return LintScorer.calculate_lint_score(
-            freq_log, al_max, content_words, concrete
-        )
+        return LintScorer.calculate_raw_score(freq_log, al_max, content_words, concrete)
 
     def get_difficulty_level(self) -> int:
         """Get difficulty level for the sentence."""
@@ -215,22 +391,89 @@ class Sentence:
 class Document:
     """Document-level readability analysis."""
 
-    def __init__(self, text: str):
+    def __init__(
+        self,
+        text: str,
+        nlp_model: Optional[Any] = None,
+        doc: Optional[spacy.tokens.Doc] = None,
+    ) -> None:
         self.text = text
-        self.nlp = Sentence._load_nlp_model()
-        self.doc = self.nlp(text)
-        self.sentences = self._tokenize_sentences()
+        if doc is None:
+            nlp_model = nlp_model or _get_nlp()
+            # Blank text has no sentences, so tokenizing it is all that's needed
+            doc = nlp_model.make_doc(text) if not text.strip() else nlp_model(text)
+        self.nlp = nlp_model
+        self.doc = doc
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts: List[str],
+        nlp_model: Optional[Any] = None,
+        batch_size: int = SPACY_BATCH_SIZE,
+        n_process: int = 1,
+    ) -> List["Document"]:
+        """
+        Create documents for several texts, parsed together in batches.
+
+        Args:
+            texts: Document texts
+            nlp_model: spaCy pipeline to use instead of the shared default
+            batch_size: Number of documents per ``nlp.pipe`` batch
+            n_process: Worker processes for parsing (-1 uses all cores; keep 1
+                on GPU so the model is not copied into every process)
 
-    def _tokenize_sentences(self) -> List[Sentence]:
-        """Split document into sentences."""
-        return [Sentence(sent.text, self.nlp) for sent in self.doc.sents]
+        Returns:
+            One document per text, in input order
+        """
+        _check_n_process(n_process)
+        nlp = nlp_model or _get_nlp()
+        docs = nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        return [cls(text, nlp, doc=doc) for text, doc in zip(texts, docs)]
+
+    @classmethod
+    def score_many(
+        cls,
+        texts: List[str],
+        nlp_model: Optional[Any] = None,
+        batch_size: int = SPACY_BATCH_SIZE,
+        n_process: int = 1,
+    ) -> List[float]:
+        """Calculate LiNT scores for several documents (see ``from_texts``)."""
+        # Scores each document as soon as it is parsed, so only one is kept alive
+        _check_n_process(n_process)
+        nlp = nlp_model or _get_nlp()
+        docs = nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        return [
+            cls(text, nlp, doc=doc).calculate_lint_score()
+            for text, doc in zip(texts, docs)
+        ]
+
+    @cached_property
+    def sentences(self) -> List[Sentence]:
+        """Sentences of the document, built on first access."""
+        if not self.text.strip():
+            return []
+
+        # The document was parsed as a whole, so each sentence is a view on
+        # that parse rather than a second run of the pipeline
+        return [Sentence.from_doc(sent, self.nlp) for sent in self.doc.sents]
+
+    @cached_property
+    def _sentence_raw_scores(self) -> List[float]:
+        """Unrounded LiNT score of every sentence, in document order."""
+        return [sentence._raw_score for sentence in self.sentences]
 
     def calculate_lint_score(self) -> float:
         """Calculate average LiNT score for the document."""
-        if not self.sentences:
+        return self._average_score(self._sentence_raw_scores)
+
+    @staticmethod
+    def _average_score(scores: List[float]) -> float:
+        """Average sentence scores into a document score."""
+        if not scores:
             return 0.0
 
-        scores = [sentence.calculate_lint_score() for sentence in self.sentences]
         return round(sum(scores) / len(scores), 2)
 
     def get_difficulty_level(self) -> int:
@@ -242,15 +485,16 @@ class Document:
         results = []
         for sentence in self.sentences:
             score = sentence.calculate_lint_score()
-            level = sentence.get_difficulty_level()
+            level = LintScorer.get_difficulty_level(score)
             results.append((sentence.text, score, level))
         return results
 
     def get_detailed_analysis(self) -> Dict[str, Any]:
         """Get detailed readability analysis."""
-        doc_score = self.calculate_lint_score()
-        doc_level = self.get_difficulty_level()
+        # Score every sentence once and derive the document figures from that
         sentence_scores = self.get_sentence_scores()
+        doc_score = self.calculate_lint_score()
+        doc_level = LintScorer.get_difficulty_level(doc_score)
 
         return {
             "document_score": doc_score,
@@ -258,8 +502,8 @@ class Document:
             "sentence_count": len(self.sentences),
             "sentence_scores": sentence_scores,
             "average_sentence_length": (
-                sum(len(s.text.split()) for s in self.sentences) / len(self.sentences)
+                sum(s.word_count for s in self.sentences) / len(self.sentences)
                 if self.sentences
-                else 0
+                else 0.0
             ),
         }
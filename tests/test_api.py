@@ -2,10 +2,15 @@
 Tests for the FastAPI endpoints.
 """
 
+import json
+import os
+import subprocess
+import sys
+
 import pytest
 from fastapi.testclient import TestClient
 
-from alletaal_lint.api import create_app
+from alletaal_lint.api import _score_sentence, create_app, remove_markdown
 
 
 @pytest.fixture
@@ -26,6 +31,24 @@ class TestAPIEndpoints:
         assert "name" in data
         assert "alletaal-lint API" in data["name"]
 
+    def test_startup_warm_up(self):
+        """Test the app starts with the warm-up lifespan."""
+        with TestClient(create_app()) as warm_client:
+            response = warm_client.get("/health")
+            assert response.status_code == 200
+
+    def test_startup_without_model(self, monkeypatch):
+        """Test a failed warm-up leaves /health reporting 503."""
+
+        def missing_model():
+            raise RuntimeError("Dutch spaCy model 'nl_core_news_sm' not found.")
+
+        monkeypatch.setattr("alletaal_lint.core._get_nlp", missing_model)
+        with TestClient(create_app()) as cold_client:
+            response = cold_client.get("/health")
+            assert response.status_code == 503
+            assert "Service unhealthy" in response.json()["detail"]
+
     def test_health_check(self, client):
         """Test health check endpoint."""
         response = client.get("/health")
@@ -60,6 +83,28 @@ class TestAPIEndpoints:
         assert isinstance(data["lint_score"], float)
         assert isinstance(data["difficulty_level"], int)
 
+    def test_invalid_n_process_setting(self):
+        """Test a bad ALLETAAL_N_PROCESS is rejected when the API is imported."""
+        env = {**os.environ, "ALLETAAL_N_PROCESS": "0"}
+        result = subprocess.run(
+            [sys.executable, "-c", "import alletaal_lint.api"],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode != 0
+        assert "ALLETAAL_N_PROCESS must be -1" in result.stderr
+
+    def test_score_batch_endpoint(self, client):
+        """Test batch scoring matches scoring documents one by one."""
+        texts = ["De kat zit op de mat.", "De hond rent in de **tuin**."]
+        response = client.post("/score-batch", json={"texts": texts})
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert results == [
+            client.post("/score-document", json={"text": text}).json() for text in texts
+        ]
+
     def test_analyze_document_endpoint(self, client):
         """Test detailed document analysis endpoint."""
         response = client.post(
@@ -85,6 +130,22 @@ class TestAPIEndpoints:
             assert "lint_score" in sentence
             assert "difficulty_level" in sentence
 
+    def test_analyze_document_stream_endpoint(self, client):
+        """Test streamed per-sentence analysis."""
+        response = client.post(
+            "/analyze-document-stream",
+            json={"text": "De kat zit op de mat. De hond rent in de tuin."},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert len(lines) == 2
+        for sentence in lines:
+            assert "sentence" in sentence
+            assert "lint_score" in sentence
+            assert "difficulty_level" in sentence
+
     def test_empty_text_handling(self, client):
         """Test handling of empty text."""
         response = client.post("/score-sentence", json={"text": ""})
@@ -100,6 +161,31 @@ class TestAPIEndpoints:
         assert response.status_code == 200
         # Should process without error even with markdown
 
+    def test_remove_markdown(self):
+        """Test markdown syntax is stripped before scoring."""
+        assert (
+            remove_markdown("**Vet** en *schuin* met [link](http://example.com)")
+            == "Vet en schuin met"
+        )
+        assert remove_markdown("# Kop | tabel ~~weg~~") == "Kop  tabel weg"
+        assert remove_markdown("Gewone zin.") == "Gewone zin."
+
+    def test_result_cache(self, client):
+        """Test repeated texts are served from the cache unless bypassed."""
+        payload = {"text": "De hond blaft naar de postbode."}
+        first = client.post("/score-sentence", json=payload)
+        hits = _score_sentence.cache_info().hits
+
+        second = client.post("/score-sentence", json=payload)
+        assert second.json() == first.json()
+        assert _score_sentence.cache_info().hits == hits + 1
+
+        bypass = client.post(
+            "/score-sentence", json=payload, headers={"Cache-Control": "no-store"}
+        )
+        assert bypass.json() == first.json()
+        assert _score_sentence.cache_info().hits == hits + 1
+
     def test_invalid_input_format(self, client):
         """Test invalid input format handling."""
         response = client.post("/score-sentence", json={"wrong_field": "test"})
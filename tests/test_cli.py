@@ -9,7 +9,7 @@ from pathlib import Path
 import pytest
 from typer.testing import CliRunner
 
-from alletaal_lint.cli import app
+from alletaal_lint.cli import app, get_difficulty_color, get_difficulty_description
 
 
 @pytest.fixture
@@ -153,6 +153,23 @@ class TestCLIOutputFormats:
         assert "Difficulty Level" in result.stdout
 
 
+class TestDifficultyLabels:
+    """Test difficulty level labels."""
+
+    def test_known_levels(self):
+        """Test descriptions and colors for valid levels."""
+        assert get_difficulty_description(1) == "Very Difficult"
+        assert get_difficulty_description(4) == "Easy"
+        assert get_difficulty_color(1) == "red"
+        assert get_difficulty_color(4) == "green"
+
+    def test_unknown_levels(self):
+        """Test fallback for out-of-range levels."""
+        for level in (-1, 0, 5):
+            assert get_difficulty_description(level) == "Unknown"
+            assert get_difficulty_color(level) == "white"
+
+
 class TestCLIFileOperations:
     """Test file input/output operations."""
 
@@ -185,6 +202,61 @@ class TestCLIFileOperations:
             if output_file.exists():
                 output_file.unlink()
 
+    def test_score_directory_invalid_n_process(self, runner):
+        """Test --n-process only accepts -1 or a positive number."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            result = runner.invoke(
+                app, ["score", "--file", tmp_dir, "--n-process", "0"]
+            )
+            assert result.exit_code == 2
+            assert "at least 1" in result.output
+
+    def test_score_directory(self, runner):
+        """Test scoring every text file in a directory."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            directory = Path(tmp_dir)
+            (directory / "a.txt").write_text("De kat zit op de mat.", encoding="utf-8")
+            (directory / "b.txt").write_text("De hond rent.", encoding="utf-8")
+            (directory / "notes.json").write_text("{}", encoding="utf-8")
+
+            result = runner.invoke(
+                app, ["score", "--file", str(directory), "--format", "json"]
+            )
+            assert result.exit_code == 0
+            data = json.loads(result.stdout)
+            assert [entry["file"] for entry in data] == ["a.txt", "b.txt"]
+            assert all(0 <= entry["document_score"] <= 100 for entry in data)
+
+            result = runner.invoke(app, ["score", "--file", str(directory)])
+            assert result.exit_code == 0
+            assert "a.txt" in result.stdout
+
+    def test_score_directory_rejects_unsupported_options(self, runner):
+        """Test directory scoring errors out on options it cannot honour."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            directory = Path(tmp_dir)
+            (directory / "a.txt").write_text("De kat zit op de mat.", encoding="utf-8")
+
+            result = runner.invoke(app, ["score", "--file", tmp_dir, "--detailed"])
+            assert result.exit_code == 1
+            assert "--detailed is not supported" in result.stdout
+
+            result = runner.invoke(app, ["score", "--file", tmp_dir, "--format", "csv"])
+            assert result.exit_code == 2
+            assert "unknown format" in result.output
+
+    def test_score_text_rejects_directory_options(self, runner):
+        """Test --format and --n-process are checked for text input too."""
+        result = runner.invoke(app, ["score", "--text", "Test zin.", "--format", "csv"])
+        assert result.exit_code == 2
+        assert "unknown format" in result.output
+
+        result = runner.invoke(
+            app, ["score", "--text", "Test zin.", "--n-process", "2"]
+        )
+        assert result.exit_code == 2
+        assert "only applies when --file is a directory" in result.output
+
     def test_input_from_file_encoding(self, runner):
         """Test reading files with different encodings."""
         # Create file with Dutch text
@@ -260,3 +332,4 @@ class TestCLIIntegration:
         result = runner.invoke(app, ["server", "--help"])
         assert result.exit_code == 0
         assert "Start the FastAPI server" in result.stdout
+        assert "--workers" in result.stdout
@@ -3,8 +3,16 @@ Tests for core LiNT functionality.
 """
 
 import pytest
+import spacy
 
-from alletaal_lint.core import Document, LintScorer, Sentence
+from alletaal_lint.core import (
+    Document,
+    LintScorer,
+    Sentence,
+    WordStats,
+    _split_tag,
+    warmup,
+)
 
 
 class TestLintScorer:
@@ -37,6 +45,13 @@ class TestLintScorer:
         score_max = LintScorer.calculate_lint_score(10, 0, 0, 1)
         assert score_max <= 100
 
+    def test_raw_score(self):
+        """Test the unrounded score is clamped and rounds to the public score."""
+        raw = LintScorer.calculate_raw_score(4.0, 2, 0.6, 0.3)
+        assert round(raw, 2) == LintScorer.calculate_lint_score(4.0, 2, 0.6, 0.3)
+        assert LintScorer.calculate_raw_score(0, 100, 0, 0) == 100.0
+        assert LintScorer.calculate_raw_score(10, 0, 0, 1) == 0.0
+
 
 class TestSentence:
     """Test sentence-level analysis."""
@@ -108,6 +123,56 @@ class TestSentence:
         assert isinstance(level, int)
         assert 1 <= level <= 4
 
+    def test_score_memoized(self, simple_sentence):
+        """Test the sentence score is computed once and reused for the level."""
+        sentence = Sentence(simple_sentence.text, simple_sentence.nlp)
+        score = sentence.calculate_lint_score()
+        sentence.__dict__["_raw_score"] = 10.0  # poison the cached value
+        assert sentence.calculate_lint_score() == 10.0
+        assert sentence.get_difficulty_level() == LintScorer.get_difficulty_level(10.0)
+        assert 0 <= score <= 100
+
+    def test_word_count(self):
+        """Test word count leaves out punctuation."""
+        assert Sentence("De kat zit op de mat.").word_count == 6
+        assert Sentence("").word_count == 0
+
+    def test_model_shared(self, simple_sentence):
+        """Test the spaCy pipeline is loaded once and shared."""
+        assert Sentence("Nog een zin.").nlp is simple_sentence.nlp
+
+    def test_warmup(self, simple_sentence):
+        """Test warmup loads the same shared pipeline."""
+        warmup()
+        assert Sentence("Nog een zin.").nlp is simple_sentence.nlp
+        assert Document("Nog een zin.").nlp is simple_sentence.nlp
+
+    def test_preparsed_doc_reused(self, simple_sentence):
+        """Test that a pre-parsed spaCy doc is used as-is."""
+        sentence = Sentence(
+            simple_sentence.text, simple_sentence.nlp, doc=simple_sentence.doc
+        )
+        assert sentence.doc is simple_sentence.doc
+        assert sentence.calculate_lint_score() == simple_sentence.calculate_lint_score()
+
+    def test_from_doc(self, simple_sentence):
+        """Test building a sentence from a parsed doc."""
+        sentence = Sentence.from_doc(simple_sentence.doc, simple_sentence.nlp)
+        assert sentence.doc is simple_sentence.doc
+        assert sentence.text == simple_sentence.text
+        assert sentence.nlp is simple_sentence.nlp
+
+    def test_from_doc_does_not_load_model(self, simple_sentence, monkeypatch):
+        """Test wrapping a parsed doc never loads the default pipeline."""
+
+        def fail():
+            raise AssertionError("default pipeline loaded")
+
+        monkeypatch.setattr("alletaal_lint.core._get_nlp", fail)
+        sentence = Sentence.from_doc(simple_sentence.doc)
+        assert sentence.nlp is None
+        assert sentence.calculate_lint_score() == simple_sentence.calculate_lint_score()
+
 
 class TestDocument:
     """Test document-level analysis."""
@@ -149,6 +214,18 @@ class TestDocument:
         assert simple_score != complex_score
         assert simple_score > 0 and complex_score > 0
 
+    def test_sentences_share_document_parse(self, simple_document):
+        """Test sentences are views on the document parse, not re-parses."""
+        for sentence in simple_document.sentences:
+            assert sentence.doc.doc is simple_document.doc
+
+    def test_sentences_scored_once(self, simple_document):
+        """Test the document score and sentence scores share one scoring pass."""
+        document = Document(simple_document.text, simple_document.nlp)
+        score = document.calculate_lint_score()
+        assert all("_raw_score" in s.__dict__ for s in document.sentences)
+        assert document.get_detailed_analysis()["document_score"] == score
+
     def test_sentence_scores(self, simple_document):
         """Test individual sentence scores."""
         sentence_scores = simple_document.get_sentence_scores()
@@ -180,6 +257,35 @@ class TestDocument:
         assert isinstance(analysis["average_sentence_length"], float)
         assert analysis["average_sentence_length"] > 0
 
+    def test_invalid_n_process(self, simple_document):
+        """Test worker counts other than -1 or >= 1 are rejected."""
+        for n_process in (0, -2):
+            with pytest.raises(ValueError, match="n_process"):
+                Document.score_many(["Test."], simple_document.nlp, n_process=n_process)
+            with pytest.raises(ValueError, match="n_process"):
+                Document.from_texts(["Test."], simple_document.nlp, n_process=n_process)
+
+    def test_score_many(self, simple_document, complex_document):
+        """Test batch scoring matches scoring documents one by one."""
+        scores = Document.score_many(
+            [simple_document.text, complex_document.text], simple_document.nlp
+        )
+        assert scores == [
+            simple_document.calculate_lint_score(),
+            complex_document.calculate_lint_score(),
+        ]
+        assert Document.score_many([], simple_document.nlp) == []
+
+    def test_from_texts(self, simple_document, complex_document):
+        """Test batch construction matches building documents one by one."""
+        texts = [simple_document.text, complex_document.text]
+        documents = Document.from_texts(texts, simple_document.nlp)
+        assert [document.text for document in documents] == texts
+        assert [document.get_detailed_analysis() for document in documents] == [
+            simple_document.get_detailed_analysis(),
+            complex_document.get_detailed_analysis(),
+        ]
+
 
 class TestWordStats:
     """Test word-level statistics."""
@@ -204,6 +310,20 @@ class TestWordStats:
                 assert isinstance(freq, float)
                 assert freq > 0
 
+    def test_morphology_properties(self):
+        """Test gender and number are read from the token morphology."""
+        doc = spacy.blank("nl")("katten")
+        doc[0].set_morph("Gender=Com|Number=Plur")
+        word_stat = WordStats(doc[0])
+        assert word_stat.gender == "Com"
+        assert word_stat.number == "Plur"
+
+    def test_split_tag(self):
+        """Test splitting fine-grained tags into main and first sub-tag."""
+        assert _split_tag("N|eigen|ev|basis") == ("N", "eigen")
+        assert _split_tag("LET") == ("LET", "")
+        assert _split_tag("") == ("", "")
+
 
 class TestIntegration:
     """Integration tests for the complete pipeline."""
@@ -214,6 +334,10 @@ class TestIntegration:
         score = doc.calculate_lint_score()
         assert score == 0.0
 
+        doc = Document("  \n\n ")
+        assert doc.sentences == []
+        assert doc.calculate_lint_score() == 0.0
+
     def test_single_word_document(self):
         """Test document with single word."""
         doc = Document("test")